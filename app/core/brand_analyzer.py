@@ -4,6 +4,7 @@ Uses GPT-4 Vision to deeply understand design patterns from past examples
 """
 from typing import List, Dict, Any, Optional
 from uuid import UUID
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 import base64
 import requests
@@ -31,6 +32,7 @@ class BrandAnalyzer:
     def __init__(self):
         self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
         self.vision_model = "gpt-4o"  # Latest vision model
+        self.max_parallel_analyses = 3  # Concurrent vision calls per request
 
     def analyze_brand_examples(
         self,
@@ -54,15 +56,21 @@ class BrandAnalyzer:
 
         logger.info(f"Analyzing {len(example_urls)} brand examples for org {org_id}")
 
-        # Analyze each image individually
+        # Analyze each image individually - the vision calls are independent
+        # and network-bound, so run a few at once (results keep input order)
         individual_analyses = []
-        for idx, url in enumerate(example_urls[:5]):  # Limit to 5 examples
-            try:
-                analysis = self._analyze_single_image(url, idx + 1)
-                individual_analyses.append(analysis)
-            except Exception as e:
-                logger.error(f"Error analyzing image {url}: {str(e)}")
-                continue
+        urls = example_urls[:5]  # Limit to 5 examples
+        with ThreadPoolExecutor(max_workers=self.max_parallel_analyses) as executor:
+            futures = [
+                executor.submit(self._analyze_single_image, url, idx + 1)
+                for idx, url in enumerate(urls)
+            ]
+            for url, future in zip(urls, futures):
+                try:
+                    individual_analyses.append(future.result())
+                except Exception as e:
+                    logger.error(f"Error analyzing image {url}: {str(e)}")
+                    continue
 
         if not individual_analyses:
             return self._get_default_analysis()
@@ -166,7 +174,7 @@ Return a detailed JSON analysis with specific, actionable observations."""
             import json
             try:
                 analysis = json.loads(content)
-            except:
+            except (TypeError, ValueError):
                 # Structure the text response
                 analysis = {
                     "raw_analysis": content,
@@ -14,6 +14,9 @@ from app.infra.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Prompts past this length start losing the user request in brand detail
+MAX_DESIGNER_PROMPT_CHARS = 500
+
 
 class BrandIntelligence:
     """
@@ -56,7 +59,8 @@ class BrandIntelligence:
                 "last_updated": datetime.now().isoformat()
             }
 
-            # Upsert to brand_guidelines table
+            # Upsert to brand_guidelines table, skipping the write when only
+            # the last_updated stamp differs from what is already stored
             db.execute("""
                 INSERT INTO brand_guidelines (org_id, guidelines, created_at, updated_at)
                 VALUES (%s, %s, NOW(), NOW())
@@ -64,6 +68,8 @@ class BrandIntelligence:
                 DO UPDATE SET
                     guidelines = EXCLUDED.guidelines,
                     updated_at = NOW()
+                WHERE (brand_guidelines.guidelines - 'last_updated')
+                    IS DISTINCT FROM (EXCLUDED.guidelines - 'last_updated')
             """, (str(org_id), json.dumps(brand_intelligence)))
 
             logger.info(f"Saved brand intelligence for org {org_id}")
@@ -134,14 +140,27 @@ class BrandIntelligence:
         # Make it CRYSTAL CLEAR to DALL-E what to generate
         prompt_parts.append(f"Create: {user_request}")
 
+        # Optional brand sections are collected first and only joined if they
+        # fit the length budget, rather than building the whole prompt and
+        # throwing it away. Room for the closing requirements (and the ". "
+        # separators) is reserved up front.
+        closing_parts = [
+            "Professional photography, high resolution, sharp focus",
+            # CRITICAL: No text or logos in generated image
+            # DALL-E needs this EXPLICIT
+            "IMPORTANT: Generate ONLY the background image with NO TEXT, NO LOGOS, NO WORDS, NO LETTERS visible anywhere in the image. Clean background only."
+        ]
+        budget = MAX_DESIGNER_PROMPT_CHARS - sum(len(p) + 2 for p in closing_parts) - 1
+        sections = []  # (text, priority) in prompt order
+
         # 2. Photography/Imagery style
         photo_style = imagery.get("photography_style", "")
         if photo_style:
-            prompt_parts.append(f"Photography style: {photo_style}")
+            sections.append((f"Photography style: {photo_style}", False))
 
         subject_matter = imagery.get("subject_matter", "")
         if subject_matter:
-            prompt_parts.append(f"Subject matter: {subject_matter}")
+            sections.append((f"Subject matter: {subject_matter}", False))
 
         # 3. Color palette
         colors = visual_id.get("colors", {})
@@ -156,40 +175,40 @@ class BrandIntelligence:
                     color_list.append(accent.get("hex", ""))
 
         if color_list:
-            prompt_parts.append(f"Color palette: {', '.join([c for c in color_list if c])}")
+            sections.append((f"Color palette: {', '.join([c for c in color_list if c])}", True))
 
         # 4. Composition rules
         comp_rules = imagery.get("composition_rules", [])
         if comp_rules:
-            prompt_parts.append(f"Composition: {', '.join(comp_rules[:3])}")
+            sections.append((f"Composition: {', '.join(comp_rules[:3])}", False))
 
         # 5. Layout principles
         grid = layout.get("grid", "")
         spacing = layout.get("spacing", {})
         if grid:
-            prompt_parts.append(f"Layout: {grid}")
+            sections.append((f"Layout: {grid}", False))
         if spacing:
             spacing_desc = ", ".join([f"{k}: {v}" for k, v in spacing.items() if v])
             if spacing_desc:
-                prompt_parts.append(f"Spacing: {spacing_desc}")
+                sections.append((f"Spacing: {spacing_desc}", False))
 
         # 6. Brand personality
         personality = messaging.get("personality", [])
         if personality:
-            prompt_parts.append(f"Brand personality: {', '.join(personality[:3])}")
+            sections.append((f"Brand personality: {', '.join(personality[:3])}", True))
 
         voice = messaging.get("voice", "")
         if voice:
-            prompt_parts.append(f"Brand voice: {voice}")
+            sections.append((f"Brand voice: {voice}", False))
 
         # 7. Visual elements and patterns
         visual_elements = patterns.get("visual_elements", [])
         if visual_elements:
-            prompt_parts.append(f"Visual elements: {', '.join(visual_elements[:3])}")
+            sections.append((f"Visual elements: {', '.join(visual_elements[:3])}", False))
 
         graphic_devices = patterns.get("graphic_devices", [])
         if graphic_devices:
-            prompt_parts.append(f"Graphic devices: {', '.join(graphic_devices[:2])}")
+            sections.append((f"Graphic devices: {', '.join(graphic_devices[:2])}", False))
 
         # 8. Learned patterns from examples
         if examples:
@@ -199,44 +218,45 @@ class BrandIntelligence:
                 if visual_dna:
                     keywords = visual_dna.get("keywords", [])
                     if keywords:
-                        prompt_parts.append(f"Visual style: {', '.join(keywords[:4])}")
+                        sections.append((f"Visual style: {', '.join(keywords[:4])}", False))
 
                 color_dna = synthesis.get("color_dna", {})
                 if color_dna:
                     palette = color_dna.get("palette", [])
                     if palette:
-                        prompt_parts.append(f"Example colors: {', '.join(palette[:3])}")
+                        sections.append((f"Example colors: {', '.join(palette[:3])}", False))
 
         # 9. Usage guidelines (dos)
         usage = brand_intelligence.get("usage_guidelines", {})
         dos = usage.get("dos", [])
         if dos:
-            prompt_parts.append(f"Best practices: {', '.join(dos[:2])}")
-
-        # 10. Quality and technical requirements
-        prompt_parts.extend([
-            "Professional photography, high resolution, sharp focus"
-        ])
-
-        # 11. CRITICAL: No text or logos in generated image
-        # DALL-E needs this EXPLICIT
-        prompt_parts.append("IMPORTANT: Generate ONLY the background image with NO TEXT, NO LOGOS, NO WORDS, NO LETTERS visible anywhere in the image. Clean background only.")
+            sections.append((f"Best practices: {', '.join(dos[:2])}", False))
+
+        # Brand colors and personality claim the budget first; photography,
+        # subject, composition and the rest fill whatever room is left.
+        # Kept sections still appear in prompt order.
+        total_len = len(prompt_parts[0])
+        kept = set()
+        skipped = []
+        for i in sorted(range(len(sections)), key=lambda i: not sections[i][1]):
+            section = sections[i][0]
+            if total_len + 2 + len(section) > budget:
+                skipped.append(section.split(":", 1)[0])
+                continue
+            kept.add(i)
+            total_len += 2 + len(section)
+
+        prompt_parts.extend(section for i, (section, _) in enumerate(sections) if i in kept)
+
+        # 10-11. Quality requirements and the no-text instruction always go last
+        prompt_parts.extend(closing_parts)
+
+        if skipped:
+            logger.warning(f"Prompt budget reached, skipped sections: {', '.join(skipped)}")
 
         # Join all parts - USER REQUEST FIRST, then brand context
         final_prompt = ". ".join([p for p in prompt_parts if p]) + "."
 
-        # Ensure user request is prominent
-        if len(final_prompt) > 500:
-            # Trim middle parts if too long, keep user request and critical parts
-            logger.warning("Prompt too long, prioritizing user request")
-            final_prompt = (
-                f"Create: {user_request}. "
-                f"{color_list[0] if color_list else ''} color palette. "
-                f"{', '.join(personality[:2]) if personality else ''} style. "
-                f"Professional photography, high resolution. "
-                f"IMPORTANT: NO TEXT, NO LOGOS, NO WORDS visible in image. Clean background only."
-            )
-
         logger.info(f"Generated designer prompt: {len(final_prompt)} chars")
         logger.debug(f"Prompt: {final_prompt}")
 
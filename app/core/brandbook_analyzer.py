@@ -4,6 +4,7 @@ Analyzes PDF brand books to extract complete brand guidelines
 """
 from typing import List, Dict, Any, Optional
 from uuid import UUID
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 import base64
 import json
@@ -35,6 +36,7 @@ class BrandBookAnalyzer:
         self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
         self.vision_model = "gpt-4o"
         self.text_model = "gpt-4o"
+        self.max_parallel_pages = 4  # Concurrent vision calls per brand book
 
     def analyze_brand_book_pdf(
         self,
@@ -74,12 +76,17 @@ class BrandBookAnalyzer:
                 logger.info(f"Extracted {len(pages_data)} pages as images")
 
                 # Step 3: Analyze each page with GPT-4 Vision
+                # Pages are independent, so several requests are kept in flight
                 if pages_data:
-                    for idx, page_data in enumerate(pages_data[:20]):  # Limit to 20 pages for cost
-                        logger.info(f"Analyzing page {idx + 1}/{min(len(pages_data), 20)}")
-                        analysis = self._analyze_page_with_vision(page_data, idx + 1)
-                        if analysis:
-                            page_analyses.append(analysis)
+                    pages_to_analyze = pages_data[:20]  # Limit to 20 pages for cost
+                    logger.info(f"Analyzing {len(pages_to_analyze)} pages with vision")
+                    with ThreadPoolExecutor(max_workers=self.max_parallel_pages) as executor:
+                        analyses = executor.map(
+                            self._analyze_page_with_vision,
+                            pages_to_analyze,
+                            range(1, len(pages_to_analyze) + 1)
+                        )
+                        page_analyses = [a for a in analyses if a]
                 else:
                     logger.warning("No pages extracted as images - will use text-only analysis")
 
@@ -109,9 +116,7 @@ class BrandBookAnalyzer:
             }
 
         except Exception as e:
-            logger.error(f"Error analyzing brand book: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error analyzing brand book: {str(e)}")
             raise
 
     def _extract_pdf_pages(self, pdf_file: BytesIO) -> List[Dict[str, Any]]:
@@ -285,7 +290,7 @@ Be SPECIFIC - include measurements, exact color codes, specific font names, prec
             # Try to parse as JSON
             try:
                 analysis = json.loads(content)
-            except:
+            except (TypeError, ValueError):
                 # If not JSON, structure the text response
                 analysis = {
                     "page_number": page_num,
@@ -446,6 +451,7 @@ Be SPECIFIC and ACTIONABLE. Include all extracted details."""
                 VALUES (%s, %s, NOW(), NOW())
                 ON CONFLICT (org_id)
                 DO UPDATE SET guidelines = EXCLUDED.guidelines, updated_at = NOW()
+                WHERE brand_guidelines.guidelines IS DISTINCT FROM EXCLUDED.guidelines
             """, (str(org_id), json.dumps(guidelines)))
 
             logger.info(f"Stored brand guidelines for org {org_id}")
@@ -5,12 +5,12 @@ Deterministic image composition with Pillow for brand overlay
 from typing import Optional, Tuple
 from uuid import UUID
 from io import BytesIO
-import requests
 from PIL import Image, ImageDraw, ImageFont, ImageColor
 from app.core.schemas import CompositionPreset, BrandKit, Asset
 from app.core.storage import storage
 from app.core.brandkit import brand_kit_manager
 from app.infra.db import db
+from app.infra.http import http_session
 from app.infra.logging import get_logger
 
 logger = get_logger(__name__)
@@ -42,7 +42,7 @@ class CompositionEngine:
                 img = Image.new('RGB', (1024, 1024), color=(200, 200, 200))
                 return img
 
-            response = requests.get(url)
+            response = http_session.get(url)
             response.raise_for_status()
             return Image.open(BytesIO(response.content))
 
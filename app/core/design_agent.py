@@ -15,14 +15,28 @@ from app.infra.logging import get_logger
 from app.core.brand_memory import brand_memory
 from app.core.brand_analyzer import brand_analyzer
 from app.core.brandbook_analyzer import brandbook_analyzer
-from app.core.brandkit import BrandKitManager
+from app.core.brandkit import brand_kit_manager
 from app.core.schemas import BrandKit, JobCreate, JobParams, AspectRatio, CompositionPreset
-from app.core.gen_openai import OpenAIImageGenerator
-from app.core.compose import CompositionEngine
-from app.core.validate import ValidationEngine
+from app.core.gen_openai import image_generator
+from app.core.compose import composition_engine
+from app.core.validate import validation_engine
 
 logger = get_logger(__name__)
 
+# Plan values -> pipeline enums, resolved once at import instead of per design
+ASPECT_RATIO_MAP = {
+    "1:1": AspectRatio.SQUARE,
+    "4:5": AspectRatio.PORTRAIT,
+    "9:16": AspectRatio.STORY,
+}
+
+LAYOUT_PRESET_MAP = {
+    "top-left-logo": CompositionPreset.TOP_LEFT_LOGO_BOTTOM_CTA,
+    "centered-logo": CompositionPreset.CENTER_LOGO_NO_TEXT,
+    "bottom-right-logo": CompositionPreset.BOTTOM_RIGHT_LOGO_TOP_TEXT,
+    "minimal": CompositionPreset.CENTER_LOGO_NO_TEXT,
+}
+
 
 class DesignAgent:
     """
@@ -38,10 +52,12 @@ class DesignAgent:
 
     def __init__(self):
         self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        self.brand_kit_manager = BrandKitManager()
-        self.image_generator = OpenAIImageGenerator()
-        self.composer = CompositionEngine()
-        self.validator = ValidationEngine()
+        # Reuse the module singletons rather than building a second set of
+        # engines (and a second OpenAI client for image generation)
+        self.brand_kit_manager = brand_kit_manager
+        self.image_generator = image_generator
+        self.composer = composition_engine
+        self.validator = validation_engine
 
     # ==================== UNDERSTAND REQUEST ====================
 
@@ -256,12 +272,7 @@ class DesignAgent:
         """
         brand_kit_id = UUID(plan["brand_kit_id"])
 
-        aspect_ratio_map = {
-            "1:1": AspectRatio.SQUARE,
-            "4:5": AspectRatio.PORTRAIT,
-            "9:16": AspectRatio.STORY,
-        }
-        aspect_ratio = aspect_ratio_map.get(plan.get("aspect_ratio", "1:1"), AspectRatio.SQUARE)
+        aspect_ratio = ASPECT_RATIO_MAP.get(plan.get("aspect_ratio", "1:1"), AspectRatio.SQUARE)
 
         # Step 1: Generate background
         job_data = JobCreate(
@@ -288,13 +299,7 @@ class DesignAgent:
             raise ValueError("No assets generated")
 
         # Step 2: Compose with brand elements
-        preset_map = {
-            "top-left-logo": CompositionPreset.TOP_LEFT_LOGO_BOTTOM_CTA,
-            "centered-logo": CompositionPreset.CENTER_LOGO_NO_TEXT,
-            "bottom-right-logo": CompositionPreset.BOTTOM_RIGHT_LOGO_TOP_TEXT,
-            "minimal": CompositionPreset.CENTER_LOGO_NO_TEXT,
-        }
-        preset = preset_map.get(plan.get("layout_choice", "centered-logo"), CompositionPreset.CENTER_LOGO_NO_TEXT)
+        preset = LAYOUT_PRESET_MAP.get(plan.get("layout_choice", "centered-logo"), CompositionPreset.CENTER_LOGO_NO_TEXT)
 
         composed_url = self.composer.compose_with_preset(
             asset_id=asset_id,
@@ -388,11 +393,12 @@ class DesignAgent:
 
         brand_info = "No brand kit configured."
         if brand_kit:
+            colors = getattr(brand_kit, "colors", object)
             style_desc = ", ".join(getattr(getattr(brand_kit, "style", object), "descriptors", []) or []) or "Not specified"
-            secondary = getattr(getattr(brand_kit, "colors", object), "secondary", None) or "Not specified"
+            secondary = getattr(colors, "secondary", None) or "Not specified"
             brand_info = f"""
 Brand Name: {getattr(brand_kit, "name", "Unknown")}
-Primary Color: {getattr(getattr(brand_kit, "colors", object), "primary", "Not specified")}
+Primary Color: {getattr(colors, "primary", "Not specified")}
 Secondary Color: {secondary}
 Style: {style_desc}
 """.strip()
@@ -444,13 +450,14 @@ Be specific and infer details when not explicitly stated."""
         else:
             patterns_text = "No patterns learned yet - using standard best practices."
 
-        style_desc = (
-            ", ".join(getattr(getattr(brand_kit, "style", object), "descriptors", []) or [])
-            if brand_kit else "Not specified"
-        )
-        brand_name = getattr(brand_kit, "name", "Not specified") if brand_kit else "Not specified"
-        primary = getattr(getattr(brand_kit, "colors", object), "primary", "Not specified") if brand_kit else "Not specified"
-        secondary = getattr(getattr(brand_kit, "colors", object), "secondary", "Not specified") if brand_kit else "Not specified"
+        if brand_kit:
+            colors = getattr(brand_kit, "colors", object)
+            style_desc = ", ".join(getattr(getattr(brand_kit, "style", object), "descriptors", []) or [])
+            brand_name = getattr(brand_kit, "name", "Not specified")
+            primary = getattr(colors, "primary", "Not specified")
+            secondary = getattr(colors, "secondary", "Not specified")
+        else:
+            style_desc = brand_name = primary = secondary = "Not specified"
 
         similar_work = ""
         if intent.get("similar_past_work"):
@@ -4,7 +4,6 @@ Integration with DALL-E 3 for AI image generation
 """
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-import requests
 import json
 import time
 from io import BytesIO
@@ -14,6 +13,7 @@ from openai import RateLimitError
 from app.core.schemas import JobCreate, Job, JobStatus, Asset, AssetCreate, AspectRatio
 from app.infra.config import settings
 from app.infra.db import db
+from app.infra.http import http_session
 from app.core.storage import storage
 from app.infra.logging import get_logger
 
@@ -241,7 +241,7 @@ class OpenAIImageGenerator:
                 image_url = response.data[0].url
                 
                 # Download and upload to Supabase Storage
-                image_data = requests.get(image_url).content
+                image_data = http_session.get(image_url).content
                 file_path = f"{org_id}/{job_id}/base_{i+1}.png"
                 public_url = storage.upload_file(
                     bucket_type="assets",
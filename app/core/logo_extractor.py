@@ -10,6 +10,7 @@ import base64
 from openai import OpenAI
 
 from app.infra.config import settings
+from app.infra.http import http_session
 from app.infra.logging import get_logger
 from app.core.storage import storage
 
@@ -108,7 +109,7 @@ Return JSON:
                 import json
                 try:
                     logo_info = json.loads(content)
-                except:
+                except (TypeError, ValueError):
                     # Extract from text
                     logo_info = {
                         "logo_found": "logo" in content.lower(),
@@ -185,10 +186,9 @@ Return JSON:
 
         try:
             from PIL import Image
-            import requests
 
             # Download base image
-            response = requests.get(base_image_url)
+            response = http_session.get(base_image_url)
             base_img = Image.open(BytesIO(response.content))
 
             # Get placement rules
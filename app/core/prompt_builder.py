@@ -74,13 +74,8 @@ class PromptBuilder:
             colors = synthesis["color_dna"]["palette"][:3]
             color_guidance = f"Color palette: {', '.join(colors)}. "
         else:
-            colors = []
-            if brand_kit.colors.primary:
-                colors.append(brand_kit.colors.primary)
-            if brand_kit.colors.secondary:
-                colors.append(brand_kit.colors.secondary)
-            if brand_kit.colors.accent:
-                colors.append(brand_kit.colors.accent)
+            kit_colors = brand_kit.colors
+            colors = [c for c in (kit_colors.primary, kit_colors.secondary, kit_colors.accent) if c]
             if colors:
                 color_guidance = f"Color palette influenced by {', '.join(colors)}. "
 
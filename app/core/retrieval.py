@@ -2,14 +2,11 @@
 Brand Corpus Retrieval
 Handles embedding generation, ingestion, and semantic search
 """
-import sys
 from pathlib import Path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 import io
+import json
 import zipfile
 from datetime import datetime
 import numpy as np
@@ -127,6 +124,10 @@ class CorpusIngestion:
             Dict with counts: {images: n, texts: n, pdfs: n}
         """
         counts = {"images": 0, "texts": 0, "pdfs": 0}
+
+        # Rows are buffered and written in one batch per column layout
+        image_rows = []
+        text_rows = []
         
         try:
             with zipfile.ZipFile(io.BytesIO(zip_data)) as zf:
@@ -140,29 +141,38 @@ class CorpusIngestion:
                     # Process images
                     if file_ext in ['.png', '.jpg', '.jpeg']:
                         with zf.open(file_info) as f:
-                            self._ingest_image(
+                            row = self._ingest_image(
                                 org_id, brand_kit_id, f.read(),
                                 file_path.name, channel
                             )
+                            if row:
+                                image_rows.append(row)
                             counts["images"] += 1
                     
                     # Process PDFs
                     elif file_ext == '.pdf':
                         with zf.open(file_info) as f:
-                            self._ingest_pdf(
+                            row = self._ingest_pdf(
                                 org_id, brand_kit_id, f.read(),
                                 file_path.name, channel
                             )
+                            if row:
+                                text_rows.append(row)
                             counts["pdfs"] += 1
                     
                     # Process text files
                     elif file_ext in ['.txt', '.md']:
                         with zf.open(file_info) as f:
-                            self._ingest_text(
+                            row = self._ingest_text(
                                 org_id, brand_kit_id, f.read().decode('utf-8'),
                                 file_path.name, channel
                             )
+                            if row:
+                                text_rows.append(row)
                             counts["texts"] += 1
+
+            self._store_rows(image_rows)
+            self._store_rows(text_rows)
             
             logger.info(f"Ingested ZIP: {counts}")
             return counts
@@ -171,6 +181,27 @@ class CorpusIngestion:
             logger.error(f"Error ingesting ZIP: {str(e)}")
             raise
     
+    def _store_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Write embedding rows in one batch, falling back to per-row inserts
+
+        Args:
+            rows: asset_embeddings rows sharing the same columns
+        """
+        try:
+            db.insert_many("asset_embeddings", rows)
+            return
+        except Exception as e:
+            logger.warning(f"Batch insert of {len(rows)} embeddings failed, retrying per file: {str(e)}")
+
+        # One bad row shouldn't discard the embeddings already generated
+        for row in rows:
+            try:
+                db.insert("asset_embeddings", row)
+            except Exception as e:
+                filename = json.loads(row["meta"])["filename"]
+                logger.warning(f"Failed to store embedding for {filename}: {str(e)}")
+    
     def _ingest_image(
         self,
         org_id: UUID,
@@ -178,8 +209,8 @@ class CorpusIngestion:
         image_data: bytes,
         filename: str,
         channel: Optional[str]
-    ) -> None:
-        """Ingest single image"""
+    ) -> Optional[Dict[str, Any]]:
+        """Build the embedding row for a single image"""
         try:
             image = Image.open(io.BytesIO(image_data))
             
@@ -190,8 +221,9 @@ class CorpusIngestion:
             w, h = image.size
             aspect = self._classify_aspect_ratio(w, h)
             
-            # Store embedding
-            db.insert("asset_embeddings", {
+            logger.debug(f"Ingested image: {filename}")
+
+            return {
                 "org_id": str(org_id),
                 "brand_kit_id": str(brand_kit_id),
                 "kind": "image",
@@ -199,13 +231,12 @@ class CorpusIngestion:
                 "aspect_ratio": aspect,
                 "content": f"Image: {filename}",
                 "embedding": f"[{','.join(map(str, embedding))}]",
-                "meta": f'{{"filename": "{filename}", "size": [{w}, {h}]}}'
-            })
-            
-            logger.debug(f"Ingested image: {filename}")
+                "meta": json.dumps({"filename": filename, "size": [w, h]})
+            }
             
         except Exception as e:
             logger.warning(f"Failed to ingest image {filename}: {str(e)}")
+            return None
     
     def _ingest_pdf(
         self,
@@ -214,8 +245,8 @@ class CorpusIngestion:
         pdf_data: bytes,
         filename: str,
         channel: Optional[str]
-    ) -> None:
-        """Ingest PDF and extract text"""
+    ) -> Optional[Dict[str, Any]]:
+        """Extract text from a PDF and build its embedding row"""
         try:
             pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_data))
             
@@ -230,25 +261,25 @@ class CorpusIngestion:
             full_text = " ".join(text_chunks)
             if len(full_text) < 10:
                 logger.warning(f"PDF {filename} has minimal text, skipping")
-                return
+                return None
             
             embedding = self.embedding_gen.generate_text_embedding(full_text)
             
-            # Store embedding
-            db.insert("asset_embeddings", {
+            logger.debug(f"Ingested PDF: {filename}")
+
+            return {
                 "org_id": str(org_id),
                 "brand_kit_id": str(brand_kit_id),
                 "kind": "pdf_text",
                 "channel": channel,
                 "content": full_text[:500],  # Store preview
                 "embedding": f"[{','.join(map(str, embedding))}]",
-                "meta": f'{{"filename": "{filename}", "pages": {len(pdf_reader.pages)}}}'
-            })
-            
-            logger.debug(f"Ingested PDF: {filename}")
+                "meta": json.dumps({"filename": filename, "pages": len(pdf_reader.pages)})
+            }
             
         except Exception as e:
             logger.warning(f"Failed to ingest PDF {filename}: {str(e)}")
+            return None
     
     def _ingest_text(
         self,
@@ -257,28 +288,29 @@ class CorpusIngestion:
         text: str,
         filename: str,
         channel: Optional[str]
-    ) -> None:
-        """Ingest plain text"""
+    ) -> Optional[Dict[str, Any]]:
+        """Build the embedding row for plain text"""
         try:
             if len(text.strip()) < 10:
-                return
+                return None
             
             embedding = self.embedding_gen.generate_text_embedding(text)
             
-            db.insert("asset_embeddings", {
+            logger.debug(f"Ingested text: {filename}")
+
+            return {
                 "org_id": str(org_id),
                 "brand_kit_id": str(brand_kit_id),
                 "kind": "text",
                 "channel": channel,
                 "content": text[:500],
                 "embedding": f"[{','.join(map(str, embedding))}]",
-                "meta": f'{{"filename": "{filename}"}}'
-            })
-            
-            logger.debug(f"Ingested text: {filename}")
+                "meta": json.dumps({"filename": filename})
+            }
             
         except Exception as e:
             logger.warning(f"Failed to ingest text {filename}: {str(e)}")
+            return None
     
     def _classify_aspect_ratio(self, width: int, height: int) -> str:
         """Classify image aspect ratio"""
@@ -2,21 +2,28 @@
 Validation Engine
 Color accuracy and logo verification for composed images
 """
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, List
 from uuid import UUID
-import requests
 from io import BytesIO
+import numpy as np
 from PIL import Image
 import imagehash
-from colormath.color_objects import sRGBColor, LabColor
-from colormath.color_conversions import convert_color
-from colormath.color_diff import delta_e_cie2000
 from app.core.schemas import ValidationResult
 from app.infra.db import db
+from app.infra.http import http_session
 from app.infra.logging import get_logger
 
 logger = get_logger(__name__)
 
+# sRGB -> XYZ matrix and D65 reference white (colormath's constants)
+SRGB_TO_XYZ = np.array([
+    [0.412424, 0.357579, 0.180464],
+    [0.212656, 0.715158, 0.0721856],
+    [0.0193324, 0.119193, 0.950444],
+])
+D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+CIE_E = 216 / 24389
+
 import json
 class UUIDEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -33,29 +40,123 @@ class ValidationEngine:
         self.color_tolerance = 2.0  # Delta E threshold
         self.logo_hash_tolerance = 5  # Perceptual hash difference tolerance
     
-    def hex_to_lab(self, hex_color: str) -> LabColor:
+    def hex_to_lab_array(self, hex_colors: List[str]) -> np.ndarray:
+        """
+        Convert HEX colors to LAB in one vectorized pass
+
+        Args:
+            hex_colors: List of HEX color strings
+
+        Returns:
+            (N, 3) array of L*, a*, b* values (D65)
+
+        Raises:
+            ValueError: If any color is shorter than 6 hex digits
         """
-        Convert HEX color to LAB color space
+        # Decode every color in one bytes.fromhex call instead of
+        # three int(..., 16) slices per color
+        packed = bytes.fromhex("".join(h.lstrip('#')[:6] for h in hex_colors))
+        # A short entry would silently shift every color after it
+        if len(packed) != 3 * len(hex_colors):
+            raise ValueError(f"Expected 6-digit HEX colors, got: {hex_colors}")
+        rgb = np.frombuffer(packed, dtype=np.uint8).reshape(-1, 3) / 255.0
+
+        # sRGB companding -> linear RGB -> XYZ normalized by reference white
+        linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        xyz = (linear @ SRGB_TO_XYZ.T) / D65_WHITE
+
+        f = np.where(xyz > CIE_E, np.cbrt(xyz), 7.787 * xyz + 16 / 116)
+        return np.stack([
+            116 * f[:, 1] - 16,
+            500 * (f[:, 0] - f[:, 1]),
+            200 * (f[:, 1] - f[:, 2])
+        ], axis=1)
+
+    def delta_e_cie2000(self, actual_colors: List[str], target_color: str) -> np.ndarray:
+        """
+        Calculate Delta E (CIE2000) of many colors against one target
 
         Args:
-            hex_color: HEX color string (e.g., "#FF5733")
+            actual_colors: HEX colors to compare
+            target_color: Target brand color (HEX)
 
         Returns:
-            LAB color object
+            Array of Delta E values, one per actual color
         """
-        # Remove # if present
-        hex_color = hex_color.lstrip('#')
+        lab = self.hex_to_lab_array(actual_colors)
+        L1, a1, b1 = lab[:, 0], lab[:, 1], lab[:, 2]
+        L2, a2, b2 = self.hex_to_lab_array([target_color])[0]
+
+        c_bar = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+        g = 0.5 * (1 - np.sqrt(c_bar ** 7 / (c_bar ** 7 + 25.0 ** 7)))
+        a1p, a2p = (1 + g) * a1, (1 + g) * a2
+        c1p, c2p = np.hypot(a1p, b1), np.hypot(a2p, b2)
+        h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+        h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+        chroma_zero = (c1p * c2p) == 0
+
+        # Hue difference wrapped to [-180, 180]
+        dhp = h2p - h1p
+        dhp = np.where(dhp > 180, dhp - 360, np.where(dhp < -180, dhp + 360, dhp))
+        dhp = np.where(chroma_zero, 0.0, dhp)
 
-        # Convert to RGB
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
+        d_lp = L2 - L1
+        d_cp = c2p - c1p
+        d_hp = 2 * np.sqrt(c1p * c2p) * np.sin(np.radians(dhp) / 2)
 
-        # Convert to LAB
-        rgb = sRGBColor(r, g, b)
-        lab = convert_color(rgb, LabColor)
+        # Mean hue, taking the short way around the circle
+        h_sum = h1p + h2p
+        h_bar = np.where(
+            chroma_zero,
+            h_sum,
+            np.where(
+                np.abs(h1p - h2p) > 180,
+                np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2),
+                h_sum / 2
+            )
+        )
+
+        l_bar = (L1 + L2) / 2
+        c_bar_p = (c1p + c2p) / 2
+        t = (
+            1
+            - 0.17 * np.cos(np.radians(h_bar - 30))
+            + 0.24 * np.cos(np.radians(2 * h_bar))
+            + 0.32 * np.cos(np.radians(3 * h_bar + 6))
+            - 0.20 * np.cos(np.radians(4 * h_bar - 63))
+        )
+        d_theta = 30 * np.exp(-(((h_bar - 275) / 25) ** 2))
+        r_c = 2 * np.sqrt(c_bar_p ** 7 / (c_bar_p ** 7 + 25.0 ** 7))
+        s_l = 1 + 0.015 * (l_bar - 50) ** 2 / np.sqrt(20 + (l_bar - 50) ** 2)
+        s_c = 1 + 0.045 * c_bar_p
+        s_h = 1 + 0.015 * c_bar_p * t
+        r_t = -np.sin(np.radians(2 * d_theta)) * r_c
+
+        return np.sqrt(
+            (d_lp / s_l) ** 2
+            + (d_cp / s_c) ** 2
+            + (d_hp / s_h) ** 2
+            + r_t * (d_cp / s_c) * (d_hp / s_h)
+        )
+
+    def _color_accuracy_result(
+        self,
+        actual_color: str,
+        target_color: str,
+        delta_e: float
+    ) -> Dict[str, Any]:
+        """Build the color accuracy dict for a computed Delta E"""
+        # Calculate accuracy percentage (Delta E < 2.0 is excellent)
+        # Scale: 0 = perfect, 2 = excellent, 5 = good, 10 = noticeable difference
+        accuracy = max(0, 100 - (delta_e * 10))
 
-        return lab
+        return {
+            "actual_color": actual_color,
+            "target_color": target_color,
+            "delta_e": float(delta_e),
+            "accuracy_percentage": round(accuracy, 1),
+            "is_acceptable": delta_e <= self.color_tolerance
+        }
 
     def validate_color_accuracy(
         self,
@@ -73,24 +174,8 @@ class ValidationEngine:
             Dict with delta_e and accuracy_percentage
         """
         try:
-            # Convert both colors to LAB
-            actual_lab = self.hex_to_lab(actual_color)
-            target_lab = self.hex_to_lab(target_color)
-
-            # Calculate Delta E
-            delta_e = delta_e_cie2000(actual_lab, target_lab)
-
-            # Calculate accuracy percentage (Delta E < 2.0 is excellent)
-            # Scale: 0 = perfect, 2 = excellent, 5 = good, 10 = noticeable difference
-            accuracy = max(0, 100 - (delta_e * 10))
-
-            return {
-                "actual_color": actual_color,
-                "target_color": target_color,
-                "delta_e": float(delta_e),
-                "accuracy_percentage": round(accuracy, 1),
-                "is_acceptable": delta_e <= self.color_tolerance
-            }
+            delta_e = float(self.delta_e_cie2000([actual_color], target_color)[0])
+            return self._color_accuracy_result(actual_color, target_color, delta_e)
 
         except Exception as e:
             logger.error(f"Error validating color: {str(e)}")
@@ -193,19 +278,15 @@ class ValidationEngine:
             img = img.resize((150, 150))
             img = img.convert('RGB')
             
-            # Get colors
-            colors = img.getcolors(img.size[0] * img.size[1])
-            
-            # Sort by frequency
-            colors = sorted(colors, key=lambda x: x[0], reverse=True)
+            # Pack each pixel into one integer and count them with NumPy
+            pixels = np.asarray(img, dtype=np.uint32).reshape(-1, 3)
+            packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+            values, counts = np.unique(packed, return_counts=True)
             
-            # Extract top colors
-            dominant_colors = []
-            for count, color in colors[:num_colors]:
-                hex_color = '#{:02x}{:02x}{:02x}'.format(*color)
-                dominant_colors.append(hex_color)
+            # Most frequent first
+            top = np.argsort(-counts, kind='stable')[:num_colors]
             
-            return dominant_colors
+            return ['#{:06x}'.format(int(v)) for v in values[top]]
             
         except Exception as e:
             logger.error(f"Error extracting colors: {str(e)}")
@@ -253,7 +334,7 @@ class ValidationEngine:
                 )
 
             # Download composed image
-            response = requests.get(composed_url)
+            response = http_session.get(composed_url)
             composed_img = Image.open(BytesIO(response.content))
             
             # Extract dominant colors from composed image
@@ -262,20 +343,15 @@ class ValidationEngine:
             # Validate primary color if present
             color_validation = None
             if brand_colors.get("primary") and dominant_colors:
-                # Check if any dominant color matches primary
-                best_match = None
-                best_delta = 100.0
-                
-                for dom_color in dominant_colors:
-                    validation = self.validate_color_accuracy(
-                        dom_color,
-                        brand_colors["primary"]
-                    )
-                    if validation["delta_e"] < best_delta:
-                        best_delta = validation["delta_e"]
-                        best_match = validation
-                
-                color_validation = best_match
+                # Score every dominant color against primary in one pass
+                # and keep the closest match
+                deltas = self.delta_e_cie2000(dominant_colors, brand_colors["primary"])
+                best = int(np.argmin(deltas))
+                color_validation = self._color_accuracy_result(
+                    dominant_colors[best],
+                    brand_colors["primary"],
+                    float(deltas[best])
+                )
             
             # Logo verification (simplified - would need region detection in production)
             logo_validation = None
@@ -29,9 +29,12 @@ class Database:
     @contextmanager
     def get_connection(self):
         """Context manager for database connections"""
+        # Server-side prepared statements don't survive the Supabase
+        # transaction pooler (port 6543), so never let psycopg create them
         conn = psycopg.connect(
             self.connection_string,
-            row_factory=dict_row
+            row_factory=dict_row,
+            prepare_threshold=None
         )
         try:
             yield conn
@@ -73,6 +76,22 @@ class Database:
         """
         return self.fetch_one(query, tuple(data.values()))
     
+    def insert_many(self, table: str, rows: List[Dict[str, Any]]) -> None:
+        """Insert several rows sharing the same columns in one batch"""
+        if not rows:
+            return
+        columns = list(rows[0].keys())
+        placeholders = ", ".join(["%s"] * len(columns))
+        query = f"""
+            INSERT INTO {table} ({", ".join(columns)})
+            VALUES ({placeholders})
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                # psycopg pipelines executemany, so this is one round trip
+                # per batch rather than one per row
+                cur.executemany(query, [tuple(row[c] for c in columns) for row in rows])
+    
     def update(self, table: str, data: Dict[str, Any], where_clause: str, where_params: tuple) -> Optional[Dict[str, Any]]:
         """Update rows and return the first updated row"""
         set_clause = ", ".join([f"{k} = %s" for k in data.keys()])
@@ -0,0 +1,14 @@
+"""
+Shared HTTP session for downloading images and files
+"""
+import requests
+
+
+# Initialize HTTP session (singleton) so repeated downloads reuse pooled
+# TCP/TLS connections to the same hosts (Supabase storage, OpenAI CDN)
+http_session = requests.Session()
+
+
+def get_http_session() -> requests.Session:
+    """Get the shared HTTP session"""
+    return http_session
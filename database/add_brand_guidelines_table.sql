@@ -16,8 +16,11 @@ CREATE TABLE IF NOT EXISTS brand_guidelines (
     UNIQUE(org_id)
 );
 
--- Index for fast lookups
-CREATE INDEX IF NOT EXISTS idx_brand_guidelines_org_id ON brand_guidelines(org_id);
+-- No separate org_id index: lookups are always "WHERE org_id = ?", which the
+-- UNIQUE(org_id) constraint already serves with its own btree.
+-- Existing installs: run drop_brand_guidelines_org_id_index.sql
+-- Note: guidelines is deliberately NOT added as an INCLUDE column - brand book
+-- JSON routinely exceeds the ~2.7KB btree tuple limit and would make upserts fail.
 
 -- Add RLS policies
 ALTER TABLE brand_guidelines ENABLE ROW LEVEL SECURITY;
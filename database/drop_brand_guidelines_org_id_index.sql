@@ -0,0 +1,7 @@
+-- Drop the redundant org_id index on brand_guidelines
+-- Run this in your Supabase SQL Editor (only needed if brand_guidelines was
+-- created before add_brand_guidelines_table.sql stopped creating the index)
+
+-- UNIQUE(org_id) already indexes org_id, so this second btree on the same
+-- column only doubles the write cost of every guidelines upsert.
+DROP INDEX IF EXISTS idx_brand_guidelines_org_id;